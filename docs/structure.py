@@ -182,6 +182,9 @@ PAGES = [
             image.show_image,
             image.warp_affine,
             image.write_image,
+            image.pad_image,
+            image.blend_linear,
+            image.apply_lookup_table,
             image.gaussian_image_blur,
             image.median_image_blur,
             image.get_rotation_matrix,
@@ -396,6 +399,7 @@ PAGES = [
             processors.SubtractMeanImage,
             processors.AddMeanImage,
             processors.NormalizeImage,
+            processors.NormalizeSubtractMeanImage,
             processors.DenormalizeImage,
             processors.LoadImage,
             processors.RandomSaturation,
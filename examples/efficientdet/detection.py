@@ -61,7 +61,8 @@ class EfficientDetPreprocess(SequentialProcessor):
                  standard_deviation=pr.RGB_IMAGENET_STDEV):
         super(EfficientDetPreprocess, self).__init__()
         self.add(pr.CastImage(float))
-        self.add(pr.SubtractMeanImage(mean=mean))
+        # CastImage returns a copy, therefore mean is subtracted in place
+        self.add(pr.SubtractMeanImage(mean=mean, in_place=True))
         self.add(pr.DivideStandardDeviationImage(standard_deviation))
         self.add(pr.ScaledResize(image_size=model.input_shape[1]))
 
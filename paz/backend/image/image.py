@@ -2,7 +2,7 @@ import numpy as np
 
 from .opencv_image import (convert_color_space, gaussian_image_blur,
                            median_image_blur, warp_affine, resize_image,
-                           RGB2HSV, HSV2RGB)
+                           blend_linear, RGB2HSV, HSV2RGB)
 
 
 def cast_image(image, dtype):
@@ -171,13 +171,25 @@ def make_random_plain_image(shape):
 
 def blend_alpha_channel(image, background):
     """Blends image with background using an alpha channel.
+    If both arrays are ``uint8`` and ``background`` has shape ''(H, W, 3)''
+    blending is done in a single openCV pass which rounds to the nearest
+    integer, otherwise values are truncated and ``background`` is broadcast.
 
     # Arguments
         image: Numpy array with alpha channel. Shape must be ''(H, W, 4)''
         background: Numpy array of shape ''(H, W, 3)''.
+
+    # Returns
+        Numpy array of type ``uint8`` and shape ''(H, W, 3)''.
     """
     if image.shape[-1] != 4:
         raise ValueError('``image`` does not contain an alpha mask.')
+    is_uint8 = (image.dtype == np.uint8) and (background.dtype == np.uint8)
+    if is_uint8 and (background.shape == (image.shape[:2] + (3,))):
+        foreground = np.ascontiguousarray(image[:, :, :3])
+        background = np.ascontiguousarray(background)
+        alpha = np.multiply(image[:, :, 3], 1.0 / 255.0, dtype=np.float32)
+        return blend_linear(foreground, background, alpha, 1.0 - alpha)
     foreground, alpha = np.split(image, [3], -1)
     alpha = alpha / 255.0
     background = (1.0 - alpha) * background.astype(float)
@@ -61,10 +61,11 @@ def load_image(filepath, num_channels=3):
         raise ValueError('Invalid number of channels')
 
     image = cv2.imread(filepath, _CHANNELS_TO_FLAG[num_channels])
+    # decoded image is not shared, therefore channels are swapped in place
     if num_channels == 3:
-        image = convert_color_space(image, BGR2RGB)
+        image = cv2.cvtColor(image, BGR2RGB, dst=image)
     elif num_channels == 4:
-        image = convert_color_space(image, BGRA2RGBA)
+        image = cv2.cvtColor(image, BGRA2RGBA, dst=image)
     return image
 
 
@@ -105,6 +106,54 @@ def warp_affine(image, matrix, fill_color=[0, 0, 0], size=None):
         image, matrix, (width, height), borderValue=fill_color)
 
 
+def pad_image(image, top, bottom, left, right, fill_color=[0, 0, 0]):
+    """ Pads ``image`` borders with a constant ``fill_color``.
+
+    # Arguments
+        image: Numpy array.
+        top: Int. Number of pixels added above the image.
+        bottom: Int. Number of pixels added below the image.
+        left: Int. Number of pixels added left to the image.
+        right: Int. Number of pixels added right to the image.
+        fill_color: List/tuple with the color used for filling the borders.
+
+    # Returns
+        Numpy array.
+    """
+    return cv2.copyMakeBorder(image, top, bottom, left, right,
+                              cv2.BORDER_CONSTANT, value=tuple(fill_color))
+
+
+def blend_linear(image_A, image_B, weights_A, weights_B):
+    """Blends two images using per-pixel weights.
+
+    # Arguments
+        image_A: Numpy array of shape ``(H, W, C)``.
+        image_B: Numpy array of shape ``(H, W, C)`` and same type as
+            ``image_A``.
+        weights_A: Float32 numpy array of shape ``(H, W)``.
+        weights_B: Float32 numpy array of shape ``(H, W)``.
+
+    # Returns
+        Numpy array of shape ``(H, W, C)``.
+    """
+    return cv2.blendLinear(image_A, image_B, weights_A, weights_B)
+
+
+def apply_lookup_table(image, lookup_table):
+    """Maps every pixel value of an ``uint8`` image using a lookup table.
+
+    # Arguments
+        image: Numpy array of type ``uint8``.
+        lookup_table: Numpy array of shape ``(256, 1, C)`` where ``C`` is
+            either one or the number of channels of ``image``.
+
+    # Returns
+        Numpy array with the shape of ``image`` and type of ``lookup_table``.
+    """
+    return cv2.LUT(image, lookup_table)
+
+
 def write_image(filepath, image):
     """Writes an image inside ``filepath``. If ``filepath`` doesn't exist
         it makes a directory. If ``image`` has three channels the image is
@@ -32,7 +32,8 @@ class PreprocessImage(SequentialProcessor):
         if mean is None:
             self.add(pr.NormalizeImage())
         else:
-            self.add(pr.SubtractMeanImage(mean))
+            # CastImage returns a copy, therefore mean is subtracted in place
+            self.add(pr.SubtractMeanImage(mean, in_place=True))
 
 
 class AutoEncoderPredictor(SequentialProcessor):
@@ -1,3 +1,4 @@
+import tensorflow as tf
 from tensorflow.keras.utils import get_file
 
 from .renderer import RenderTwoViews
@@ -235,9 +236,13 @@ class HigherHRNetHumanPose2D(Processor):
         self.with_flip = with_flip
         self.draw = draw
         self.model = HigherHRNet(weights=dataset)
+        # unknown spatial shape lets a single trace serve every image size
+        self._traced_model = tf.function(
+            lambda image: self.model(image, training=False),
+            input_signature=[tf.TensorSpec((None, None, None, 3), tf.float32)])
         self.transform_image = PreprocessImageHigherHRNet()
         self.get_heatmaps_and_tags = pr.SequentialProcessor(
-            [GetHeatmapsAndTags(self.model, flipped_keypoint_order,
+            [GetHeatmapsAndTags(self._infer, flipped_keypoint_order,
              with_flip, data_with_center), pr.AggregateResults(with_flip)])
         self.get_keypoints = GetKeypoints(max_num_people, keypoint_order)
         self.transform_keypoints = TransformKeypoints(inverse=True)
@@ -245,6 +250,10 @@ class HigherHRNetHumanPose2D(Processor):
         self.extract_keypoints_locations = pr.ExtractKeypointsLocations()
         self.wrap = pr.WrapOutput(['image', 'keypoints', 'scores'])
 
+    def _infer(self, image):
+        # eager model casts any input dtype, traced signature expects float32
+        return self._traced_model(tf.cast(image, tf.float32))
+
     def call(self, image):
         resized_image, center, scale = self.transform_image(image)
         heatmaps, tags = self.get_heatmaps_and_tags(resized_image)
@@ -37,6 +37,7 @@ from .image import CastImage
 from .image import SubtractMeanImage
 from .image import AddMeanImage
 from .image import NormalizeImage
+from .image import NormalizeSubtractMeanImage
 from .image import DenormalizeImage
 from .image import LoadImage
 from .image import RandomSaturation
@@ -7,6 +7,7 @@ from ..backend.boxes import to_image_coordinates
 from ..backend.boxes import to_normalized_coordinates
 from ..backend.boxes import compute_iou
 from ..backend.image import warp_affine
+from ..backend.image import pad_image
 from ..backend.image import translate_image
 from ..backend.image import sample_scaled_translation
 from ..backend.image import get_rotation_matrix
@@ -79,7 +80,6 @@ class RandomSampleCrop(Processor):
         H_original, W_original = image.shape[:2]
         while True:
             mode = np.random.randint(0, len(self.jaccard_min_max), 1)[0]
-            print(mode)
             min_iou, max_iou = self.jaccard_min_max[mode]
             for trial_arg in range(self.max_trials):
                 W = np.random.uniform(0.3 * W_original, W_original)
@@ -143,24 +143,22 @@ class Expand(Processor):
     def call(self, image, boxes):
         if self.probability < np.random.rand():
             return image, boxes
-        height, width, num_channels = image.shape
+        height, width = image.shape[:2]
         ratio = np.random.uniform(1, self.max_ratio)
-        left = np.random.uniform(0, width * ratio - width)
-        top = np.random.uniform(0, height * ratio - height)
-        expanded_image = np.zeros((int(height * ratio),
-                                   int(width * ratio), num_channels),
-                                  dtype=image.dtype)
+        left = int(np.random.uniform(0, width * ratio - width))
+        top = int(np.random.uniform(0, height * ratio - height))
+        right = int(width * ratio) - left - width
+        bottom = int(height * ratio) - top - height
 
         if self.mean is None:
-            expanded_image[:, :, :] = np.mean(image, axis=(0, 1))
+            fill_color = np.mean(image, axis=(0, 1))
         else:
-            expanded_image[:, :, :] = self.mean
+            fill_color = self.mean
 
-        expanded_image[int(top):int(top + height),
-                       int(left):int(left + width)] = image
+        expanded_image = pad_image(image, top, bottom, left, right, fill_color)
         expanded_boxes = boxes.copy()
-        expanded_boxes[:, 0:2] = boxes[:, 0:2] + (int(left), int(top))
-        expanded_boxes[:, 2:4] = boxes[:, 2:4] + (int(left), int(top))
+        expanded_boxes[:, 0:2] = boxes[:, 0:2] + (left, top)
+        expanded_boxes[:, 2:4] = boxes[:, 2:4] + (left, top)
         return expanded_image, expanded_boxes
 
 
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from ..abstract import Processor
@@ -24,6 +27,7 @@ from ..backend.image import normalized_device_coordinates_to_image
 from ..backend.image import image_to_normalized_device_coordinates
 from ..backend.image import replace_lower_than_threshold
 from ..backend.image import flip_left_right
+from ..backend.image import apply_lookup_table
 from ..backend.image import BILINEAR, CUBIC
 from ..backend.image.tensorflow_image import imagenet_preprocess_input
 
@@ -54,12 +58,18 @@ class SubtractMeanImage(Processor):
 
     # Arguments
         mean: List of length 3, containing the channel-wise mean.
+        in_place: Boolean. If ``True`` floating point images are modified
+            in place instead of allocating a new image. Only use it if the
+            given image is not used anywhere else.
     """
-    def __init__(self, mean):
-        self.mean = mean
+    def __init__(self, mean, in_place=False):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.in_place = in_place
         super(SubtractMeanImage, self).__init__()
 
     def call(self, image):
+        if self.in_place and np.issubdtype(image.dtype, np.floating):
+            return np.subtract(image, self.mean, out=image)
         return image - self.mean
 
 
@@ -68,12 +78,18 @@ class AddMeanImage(Processor):
 
     # Arguments
         mean: List of length 3, containing the channel-wise mean.
+        in_place: Boolean. If ``True`` floating point images are modified
+            in place instead of allocating a new image. Only use it if the
+            given image is not used anywhere else.
     """
-    def __init__(self, mean):
-        self.mean = mean
+    def __init__(self, mean, in_place=False):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.in_place = in_place
         super(AddMeanImage, self).__init__()
 
     def call(self, image):
+        if self.in_place and np.issubdtype(image.dtype, np.floating):
+            return np.add(image, self.mean, out=image)
         return image + self.mean
 
 
@@ -87,6 +103,38 @@ class NormalizeImage(Processor):
         return image / 255.0
 
 
+class NormalizeSubtractMeanImage(Processor):
+    """Subtracts channel-wise mean to image and divides all values by 255.0.
+    Equivalent to ``SubtractMeanImage`` followed by ``NormalizeImage`` but
+    it allocates a single ``float32`` image. For ``uint8`` images all
+    operations are done with a single per-channel lookup table.
+
+    # Arguments
+        mean: List of length 3, containing the channel-wise mean.
+    """
+    def __init__(self, mean):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self._normalized_mean = self.mean / 255.0
+        values = np.arange(256, dtype=np.float32).reshape(256, 1, 1) / 255.0
+        normalized_mean = self._normalized_mean.reshape(1, 1, -1)
+        self._lookup_table = values - normalized_mean
+        super(NormalizeSubtractMeanImage, self).__init__()
+
+    def _is_lookup_compatible(self, image):
+        num_channels = self._lookup_table.shape[-1]
+        return ((image.dtype == np.uint8) and (image.ndim == 3) and
+                (num_channels in [1, image.shape[-1]]))
+
+    def call(self, image):
+        if self._is_lookup_compatible(image):
+            # openCV drops singleton channel axis e.g. (H, W, 1) -> (H, W)
+            image_shape = image.shape
+            image = apply_lookup_table(image, self._lookup_table)
+            return image.reshape(image_shape)
+        image = np.multiply(image, np.float32(1.0 / 255.0), dtype=np.float32)
+        return np.subtract(image, self._normalized_mean, out=image)
+
+
 class DenormalizeImage(Processor):
     """Denormalize image by multiplying all values by 255.0.
     """
@@ -178,7 +226,9 @@ class ResizeImage(Processor):
     """Resize image.
 
     # Arguments
-        size: List of two ints.
+        shape: List of two ints.
+        method: Flag indicating interpolation method i.e.
+            paz.backend.image.CUBIC
     """
     def __init__(self, shape, method=BILINEAR):
         self.shape = shape
@@ -190,17 +240,31 @@ class ResizeImage(Processor):
 
 
 class ResizeImages(Processor):
-    """Resize list of images.
+    """Resize list of images. Lists with at least ``min_parallel`` images
+    are resized concurrently since openCV releases the GIL while resizing.
 
     # Arguments
-        size: List of two ints.
+        shape: List of two ints.
+        num_workers: Int. Number of threads used for resizing.
+            If ``None`` the ``ThreadPoolExecutor`` default is used.
+        min_parallel: Int. Minimum number of images for which the thread
+            pool is used. Smaller lists are resized serially.
     """
-    def __init__(self, shape):
+    def __init__(self, shape, num_workers=None, min_parallel=8):
         self.shape = shape
+        self.num_workers = num_workers
+        self.min_parallel = min_parallel
         super(ResizeImages, self).__init__()
 
+    def _resize_image(self, image):
+        return resize_image(image, self.shape)
+
     def call(self, images):
-        return [resize_image(image, self.shape) for image in images]
+        if len(images) < self.min_parallel:
+            return [self._resize_image(image) for image in images]
+        # pool is not kept such that processor can be pickled or forked
+        with ThreadPoolExecutor(self.num_workers) as executor:
+            return list(executor.map(self._resize_image, images))
 
 
 class RandomImageBlur(Processor):
@@ -352,19 +416,41 @@ class BlendRandomCroppedBackground(Processor):
     # Arguments
         background_paths: List of strings. Each element of the list is a
             full-path to an image used for cropping a background.
+        cache_size: Int. Maximum number of decoded backgrounds kept in
+            memory instead of reading them from disk on every call. Each
+            cached background takes its full decoded size e.g. ~6MB for a
+            1920x1080 RGB image. If ``0`` no background is cached and if
+            ``None`` all loaded backgrounds are kept.
     """
-    def __init__(self, background_paths):
+    def __init__(self, background_paths, cache_size=0):
         super(BlendRandomCroppedBackground, self).__init__()
         if not isinstance(background_paths, list):
             raise ValueError('``background_paths`` must be list')
         if len(background_paths) == 0:
             raise ValueError('No paths given in ``background_paths``')
         self.background_paths = background_paths
+        self.cache_size = cache_size
+        self._backgrounds = OrderedDict()
+
+    def _load_background(self, filepath):
+        if self.cache_size == 0:
+            return load_image(filepath)
+        if filepath in self._backgrounds:
+            self._backgrounds.move_to_end(filepath)
+            return self._backgrounds[filepath]
+        background = load_image(filepath)
+        # cached backgrounds are shared between calls
+        background.flags.writeable = False
+        self._backgrounds[filepath] = background
+        if self.cache_size is not None:
+            while len(self._backgrounds) > self.cache_size:
+                self._backgrounds.popitem(last=False)
+        return background
 
     def call(self, image):
         random_arg = np.random.randint(0, len(self.background_paths))
         background_path = self.background_paths[random_arg]
-        background = load_image(background_path)
+        background = self._load_background(background_path)
         background = random_shape_crop(background, image.shape[:2])
         if background is None:
             H, W, num_channels = image.shape
@@ -395,13 +481,9 @@ class AddOcclusion(Processor):
         angle_delta = 2 * np.pi / num_vertices
         initial_angle = np.random.uniform(0, 2 * np.pi)
         angles = initial_angle + np.arange(0, num_vertices) * angle_delta
-        x_component = np.cos(angles).reshape(-1, 1)
-        y_component = np.sin(angles).reshape(-1, 1)
-        vertices = np.concatenate([x_component, y_component], -1)
-        random_lengths = np.random.uniform(0, max_radius, num_vertices)
-        random_lengths = random_lengths.reshape(num_vertices, 1)
-        vertices = vertices * random_lengths
-        vertices = vertices + center
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        random_lengths = np.random.uniform(0, max_radius, (num_vertices, 1))
+        vertices = directions * random_lengths + center
         return vertices.astype(np.int32)
 
     def add_occlusion(self, image, max_radius_scale):
@@ -436,11 +518,11 @@ class RandomImageCrop(Processor):
         H, W = image.shape[:2]
         W_crop = np.random.uniform(self.crop_factor * W, W)
         H_crop = np.random.uniform(self.crop_factor * H, H)
-        x_min = np.random.uniform(W - W_crop)
-        y_min = np.random.uniform(H - H_crop)
+        x_min = np.random.uniform(0, W - W_crop)
+        y_min = np.random.uniform(0, H - H_crop)
         x_max = x_min + W_crop
         y_max = y_min + H_crop
-        cropped_image = image[int(x_min):int(x_max), int(y_min):int(y_max), :]
+        cropped_image = image[int(y_min):int(y_max), int(x_min):int(x_max), :]
         return cropped_image
 
 
@@ -100,6 +100,37 @@ def test_alpha_blend(load_image, image_shape, rgb):
     assert np.all(alpha_blend_image == test_image)
 
 
+def test_blend_alpha_channel_uint8():
+    image = np.random.randint(0, 256, (32, 32, 4)).astype(np.uint8)
+    background = np.random.randint(0, 256, (32, 32, 3)).astype(np.uint8)
+    blended_image = opencv_image.blend_alpha_channel(image, background)
+    alpha = image[:, :, 3:] / 255.0
+    target = (alpha * image[:, :, :3]) + ((1.0 - alpha) * background)
+    assert blended_image.dtype == np.uint8
+    assert blended_image.shape == (32, 32, 3)
+    assert np.all(np.abs(blended_image - target) <= 1.0)
+
+
+def test_blend_alpha_channel_float():
+    image = np.random.randint(0, 256, (32, 32, 4)).astype(np.float64)
+    background = np.random.randint(0, 256, (32, 32, 3)).astype(np.float64)
+    blended_image = opencv_image.blend_alpha_channel(image, background)
+    alpha = image[:, :, 3:] / 255.0
+    target = (alpha * image[:, :, :3]) + ((1.0 - alpha) * background)
+    assert blended_image.dtype == np.uint8
+    assert np.all(blended_image == target.astype(np.uint8))
+
+
+def test_blend_alpha_channel_broadcast_background():
+    image = np.random.randint(0, 256, (32, 32, 4)).astype(np.uint8)
+    background = np.random.randint(0, 256, (32, 32, 1)).astype(np.uint8)
+    blended_image = opencv_image.blend_alpha_channel(image, background)
+    alpha = image[:, :, 3:] / 255.0
+    target = (alpha * image[:, :, :3]) + ((1.0 - alpha) * background)
+    assert blended_image.shape == (32, 32, 3)
+    assert np.all(blended_image == target.astype(np.uint8))
+
+
 @pytest.fixture
 def image_with_face_fullpath():
     URL = ('https://github.com/oarriaga/altamira-data/releases/download'
@@ -54,3 +54,16 @@ def test_random_sample_crop():
         assert len(crop_boxes.shape) == 2
         assert np.alltrue(crop_boxes[:, 0] < crop_boxes[:, 2])
         assert np.alltrue(crop_boxes[:, 1] < crop_boxes[:, 3])
+
+
+def test_expand_image_shape_and_fill(boxes_with_label):
+    image = np.full((300, 300, 3), 255, dtype=np.uint8)
+    expand = pr.Expand(max_ratio=2, mean=(104, 117, 123), probability=1.0)
+    expanded_image, expanded_boxes = expand(image, boxes_with_label)
+    left, top = (expanded_boxes[0, :2] - boxes_with_label[0, :2]).astype(int)
+    H, W = expanded_image.shape[:2]
+    assert (H >= 300) and (W >= 300)
+    assert expanded_image.dtype == np.uint8
+    assert np.all(expanded_image[top:top + 300, left:left + 300] == 255)
+    assert np.sum(np.all(expanded_image == (104, 117, 123), -1)) == (
+        (H * W) - (300 * 300))
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 import numpy as np
 
@@ -110,3 +111,156 @@ def test_Scale(object_sizes):
     values = np.array([1.0, 0.5, 0.25])
     scaled_values = scale(values)
     assert np.allclose(scaled_values, values * object_sizes)
+
+
+def test_SubtractMeanImage_does_not_mutate_input():
+    image = np.full((4, 4, 3), 200.0, dtype=np.float64)
+    subtract_mean = pr.SubtractMeanImage(pr.BGR_IMAGENET_MEAN)
+    for _ in range(2):
+        subtracted_image = subtract_mean(image)
+        assert subtracted_image is not image
+        assert np.allclose(image, 200.0)
+        assert np.allclose(
+            subtracted_image, 200.0 - np.array(pr.BGR_IMAGENET_MEAN))
+
+
+def test_AddMeanImage_does_not_mutate_input():
+    image = np.zeros((4, 4, 3), dtype=np.float32)
+    added_image = pr.AddMeanImage(pr.BGR_IMAGENET_MEAN)(image)
+    assert np.allclose(image, 0.0)
+    assert np.allclose(added_image, np.array(pr.BGR_IMAGENET_MEAN))
+
+
+def test_SubtractMeanImage_in_place():
+    image = np.full((4, 4, 3), 200.0, dtype=np.float32)
+    subtract_mean = pr.SubtractMeanImage(pr.BGR_IMAGENET_MEAN, in_place=True)
+    subtracted_image = subtract_mean(image)
+    assert subtracted_image is image
+    assert np.allclose(image, 200.0 - np.array(pr.BGR_IMAGENET_MEAN))
+
+
+def test_SubtractMeanImage_uint8():
+    image = np.full((4, 4, 3), 200, dtype=np.uint8)
+    subtracted_image = pr.SubtractMeanImage(pr.BGR_IMAGENET_MEAN)(image)
+    assert subtracted_image.dtype == np.float32
+    assert np.allclose(subtracted_image, 200 - np.array(pr.BGR_IMAGENET_MEAN))
+
+
+def test_NormalizeSubtractMeanImage():
+    image = np.random.randint(0, 256, (4, 4, 3)).astype(np.uint8)
+    mean = pr.BGR_IMAGENET_MEAN
+    normalized_image = pr.NormalizeSubtractMeanImage(mean)(image)
+    assert normalized_image.dtype == np.float32
+    assert np.allclose(normalized_image, (image - np.array(mean)) / 255.0)
+
+
+def test_ResizeImages():
+    images = [np.ones((H, W, 3), dtype=np.uint8) for H, W in
+              [(32, 48), (64, 64), (128, 96)]]
+    for min_parallel in [1, len(images) + 1]:
+        resize_images = pr.ResizeImages((20, 10), min_parallel=min_parallel)
+        resized_images = resize_images(images)
+        assert len(resized_images) == len(images)
+        for resized_image in resized_images:
+            assert resized_image.shape == (10, 20, 3)
+
+
+def test_ResizeImages_pickle_after_parallel_call():
+    images = [np.ones((32, 32, 3), dtype=np.uint8) for _ in range(4)]
+    resize_images = pr.ResizeImages((16, 16), min_parallel=1)
+    resize_images(images)
+    resize_images = pickle.loads(pickle.dumps(resize_images))
+    resized_images = resize_images(images)
+    assert all(image.shape == (16, 16, 3) for image in resized_images)
+
+
+def test_RandomImageCrop_shape():
+    image = np.ones((20, 200, 3))
+    random_image_crop = pr.RandomImageCrop(crop_factor=0.9, probability=1.0)
+    for seed in range(100):
+        np.random.seed(seed)
+        cropped_image = random_image_crop(image)
+        np.random.seed(seed)
+        np.random.rand()
+        W_crop = np.random.uniform(0.9 * 200, 200)
+        H_crop = np.random.uniform(0.9 * 20, 20)
+        x_min = np.random.uniform(0, 200 - W_crop)
+        y_min = np.random.uniform(0, 20 - H_crop)
+        x_max, y_max = x_min + W_crop, y_min + H_crop
+        assert (x_max <= 200) and (y_max <= 20)
+        H, W = cropped_image.shape[:2]
+        assert H == int(y_max) - int(y_min)
+        assert W == int(x_max) - int(x_min)
+
+
+def test_NormalizeSubtractMeanImage_lookup_table():
+    image = np.random.randint(0, 256, (8, 8, 3)).astype(np.uint8)
+    normalize_subtract_mean = pr.NormalizeSubtractMeanImage(
+        pr.BGR_IMAGENET_MEAN)
+    lookup_image = normalize_subtract_mean(image)
+    float_image = normalize_subtract_mean(image.astype(np.float32))
+    assert lookup_image.dtype == np.float32
+    assert lookup_image.shape == image.shape
+    assert np.allclose(lookup_image, float_image, atol=1e-6)
+
+
+def test_NormalizeSubtractMeanImage_lookup_table_grayscale():
+    image = np.random.randint(0, 256, (8, 8, 1)).astype(np.uint8)
+    normalize_subtract_mean = pr.NormalizeSubtractMeanImage([127])
+    lookup_image = normalize_subtract_mean(image)
+    float_image = normalize_subtract_mean(image.astype(np.float32))
+    assert lookup_image.dtype == np.float32
+    assert lookup_image.shape == image.shape == float_image.shape
+    assert np.allclose(lookup_image, float_image, atol=1e-6)
+
+
+def test_BlendRandomCroppedBackground_cache(monkeypatch):
+    import paz.processors.image as image_processors
+    num_reads = []
+
+    def load_image(filepath, num_channels=3):
+        num_reads.append(filepath)
+        return np.full((64, 64, 3), 255, dtype=np.uint8)
+
+    monkeypatch.setattr(image_processors, 'load_image', load_image)
+    blend = pr.BlendRandomCroppedBackground(['background.png'], cache_size=1)
+    image = np.zeros((32, 32, 4), dtype=np.uint8)
+    for _ in range(2):
+        blended_image = blend(image)
+        assert blended_image.shape == (32, 32, 3)
+        assert np.all(blended_image == 255)
+    assert len(num_reads) == 1
+    cached_background = blend._load_background('background.png')
+    assert not cached_background.flags.writeable
+
+
+def test_BlendRandomCroppedBackground_cache_eviction(monkeypatch):
+    import paz.processors.image as image_processors
+    num_reads = []
+
+    def load_image(filepath, num_channels=3):
+        num_reads.append(filepath)
+        return np.full((64, 64, 3), 255, dtype=np.uint8)
+
+    monkeypatch.setattr(image_processors, 'load_image', load_image)
+    paths = ['background_0.png', 'background_1.png']
+    blend = pr.BlendRandomCroppedBackground(paths, cache_size=1)
+    for path in ['background_0.png', 'background_1.png', 'background_0.png']:
+        blend._load_background(path)
+    assert num_reads == paths + ['background_0.png']
+    assert list(blend._backgrounds.keys()) == ['background_0.png']
+
+
+def test_BlendRandomCroppedBackground_cache_pickle(monkeypatch):
+    import paz.processors.image as image_processors
+
+    def load_image(filepath, num_channels=3):
+        return np.full((64, 64, 3), 255, dtype=np.uint8)
+
+    monkeypatch.setattr(image_processors, 'load_image', load_image)
+    blend = pr.BlendRandomCroppedBackground(['background.png'], cache_size=1)
+    image = np.zeros((32, 32, 4), dtype=np.uint8)
+    blend(image)
+    blend = pickle.loads(pickle.dumps(blend))
+    assert list(blend._backgrounds.keys()) == ['background.png']
+    assert np.all(blend(image) == 255)